@@ -16,15 +16,23 @@
 #   You should have received a copy of the GNU Affero General Public License
 #   along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import collections
+import concurrent.futures
+import functools
 import os
-import os.path
-import re
+import pathlib
 import time
 import supybot
 import threading
 import requests
 import shutil
 from enum import Enum
+from urllib3.util import Retry
+
+try:
+    import inotify_simple
+except ImportError:
+    inotify_simple = None
 
 from supybot import ircdb, log, schedule
 from supybot.commands import wrap, many
@@ -47,8 +55,11 @@ from DebianDevelChangesBot.utils import (
     madison,
     format_email_address,
     popcon,
+    union_regex,
+    bug_mail_packages,
 )
 from DebianDevelChangesBot.utils.decoding import split_address
+from DebianDevelChangesBot.utils.union_regex import MATCH_NOTHING
 
 
 def schedule_remove_event(event):
@@ -65,6 +76,44 @@ def schedule_remove_periodic_event(event):
         pass
 
 
+# Replies of the commands, colourised once; only the variable parts are filled
+# in per reply.
+_MAINTAINER_REPLY = colourise(
+    "[desc]Maintainer for[reset] [package]{package}[reset] [desc]is[reset] [by]{display_name}[reset]: [url]https://qa.debian.org/developer.php?login={login}[/url]"
+)
+_UNKNOWN_PACKAGE_REPLY = colourise('Unknown source package "{package}"')
+_QA_REPLY = colourise(
+    "[desc]QA page for[reset] [package]{package}[reset]: [url]https://tracker.debian.org/pkg/{package}[/url]"
+)
+_CHANGELOG_REPLY = colourise(
+    "[desc]debian/changelog for[reset] [package]{package}[reset]: [url]https://packages.debian.org/changelogs/pool/main/{pool_url[0]}/{pool_url[1]}/current/changelog[/url]"
+)
+_COPYRIGHT_REPLY = colourise(
+    "[desc]debian/copyright for[reset] [package]{package}[reset]: [url]https://packages.debian.org/changelogs/pool/main/{pool_url[0]}/{pool_url[1]}/current/copyright[/url]"
+)
+_BUGGRAPH_REPLY = colourise(
+    "[desc]Bug graph for[reset] [package]{package}[reset]: [url]https://qa.debian.org/data/bts/graphs/{package[0]}/{package}.png[/url]"
+)
+_BUILDD_REPLY = colourise(
+    "[desc]buildd status for[reset] [package]{package}[reset]: [url]https://buildd.debian.org/pkg.cgi?pkg={package}[/url]"
+)
+_TESTING_REPLY = colourise(
+    "[desc]Testing migration status for[reset] [package]{package}[reset]: [url]https://qa.debian.org/excuses.php?package={package}[/url]"
+)
+_NEW_REPLY = colourise(
+    "[desc]NEW queue is[reset]: [url]https://ftp-master.debian.org/new.html[/url]. [desc]Current size is:[reset] {size}"
+)
+_RC_REPLY = "There are {num_bugs} release-critical bugs in the testing distribution. See https://udd.debian.org/bugs.cgi?release=bullseye&notmain=ign&merged=ign&rc=1"
+
+
+@functools.lru_cache(maxsize=4096)
+def get_pool_url(package):
+    if package.startswith("lib"):
+        return (package[:4], package)
+    else:
+        return (package[:1], package)
+
+
 class ProcessingResult(Enum):
     ACTION = 2
     NO_ACTION = 1
@@ -75,6 +124,8 @@ class DebianDevelChanges(supybot.callbacks.Plugin):
     threaded = True
 
     def __init__(self, irc):
+        # cached registry values, cleared every minute
+        self.registry_cache = {}
         super().__init__(irc)
         self.irc = irc
         self.topic_lock = threading.Lock()
@@ -82,9 +133,35 @@ class DebianDevelChanges(supybot.callbacks.Plugin):
 
         self.requests_session = requests.Session()
         self.requests_session.verify = True
+        self.requests_session.headers["User-Agent"] = (
+            f"debian-devel-changes-bot {requests.utils.default_user_agent()}"
+        )
+        # keep connections to the handful of Debian hosts alive across the
+        # concurrent updates and retry transient server errors
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                raise_on_status=False,
+                # a long Retry-After would stall an update worker
+                respect_retry_after_header=False,
+            ),
+        )
+        self.requests_session.mount("https://", adapter)
+        self.requests_session.mount("http://", adapter)
 
         self.queued_topics = {}
-        self.last_n_messages = []
+        # channel -> (topic, rewritten topic, values used for the rewrite)
+        self.topic_rewrites = {}
+        # channels with a scheduled topic change
+        self.pending_topics = set()
+        self.last_n_messages = collections.deque(maxlen=20)
+        self.last_n_messages_set = set()
+        # union of all channels' package_regex and the patterns it was built from
+        self.package_union = ((), MATCH_NOTHING)
 
         # data sources
         pseudo_packages.pp = PseudoPackages(self.requests_session)
@@ -107,50 +184,87 @@ class DebianDevelChanges(supybot.callbacks.Plugin):
             self.rm_queue,
             self.apt_archive,
         )
+        # datasource updates are I/O bound, so run them off the scheduler
+        # thread and in parallel
+        self.update_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(self.data_sources), thread_name_prefix="ddc-update"
+        )
 
         # Schedule datasource updates
-        def wrapper(source):
-            def implementation():
-                try:
-                    source.update()
-                except Exception as e:
-                    log.exception(f"Failed to update {source.NAME}: {e}")
-                self._topic_callback()
-
-            return implementation
-
         for source in self.data_sources:
+            update = functools.partial(self._schedule_update, source)
             # schedule periodic events
-            schedule.addPeriodicEvent(
-                wrapper(source), source.INTERVAL, source.NAME, now=False
-            )
+            schedule.addPeriodicEvent(update, source.INTERVAL, source.NAME, now=False)
             # and run them now once
-            schedule.addEvent(wrapper(source), time.time() + 1)
+            schedule.addEvent(update, time.time() + 1)
 
         # Schedule mail update
-        self._inject_maildir = os.path.expanduser("~/inject")
-        if not os.path.isdir(self._inject_maildir):
-            os.mkdir(self._inject_maildir)
-        self._failed_maildir = os.path.expanduser("~/failed-mails")
-        if not os.path.isdir(self._failed_maildir):
-            os.mkdir(self._failed_maildir)
-        self._processed_maildir = os.path.expanduser("~/processed-mails")
-        if not os.path.isdir(self._processed_maildir):
-            os.mkdir(self._processed_maildir)
-
-        schedule.addPeriodicEvent(self._email_callback, 60, "process-mail", now=False)
+        home = pathlib.Path.home()
+        for attr, name in (
+            ("_inject_maildir", "inject"),
+            ("_failed_maildir", "failed-mails"),
+            ("_processed_maildir", "processed-mails"),
+        ):
+            maildir = home / name
+            maildir.mkdir(exist_ok=True)
+            setattr(self, attr, str(maildir))
+
+        # With inotify, new mails are processed as soon as they are moved into
+        # the maildir and polling is only a fallback for lost events.
+        self.mail_watcher_stop = threading.Event()
+        if self._start_mail_watcher():
+            mail_interval = 600
+        else:
+            mail_interval = 60
+        schedule.addPeriodicEvent(
+            self._email_callback, mail_interval, "process-mail", now=False
+        )
 
         # Schedule rejoins
         schedule.addPeriodicEvent(self._rejoin_channels, 600, "rejoin", now=False)
 
+        # Pick up configuration changes
+        schedule.addPeriodicEvent(
+            self.registry_cache.clear, 60, "clear-registry-cache", now=False
+        )
+
     def die(self):
+        schedule_remove_periodic_event("clear-registry-cache")
         schedule_remove_periodic_event("rejoin")
         schedule_remove_periodic_event("process-mail")
         for source in self.data_sources:
             schedule_remove_periodic_event(source.NAME)
+        self.update_pool.shutdown(wait=False, cancel_futures=True)
+        self.mail_watcher_stop.set()
 
         super().die()
 
+    def registryValue(self, name, *args, **kwargs):
+        # looking up a value walks the registry tree, so cache the results
+        key = (name, args, tuple(sorted(kwargs.items())))
+        try:
+            return self.registry_cache[key]
+        except KeyError:
+            pass
+
+        value = super().registryValue(name, *args, **kwargs)
+        self.registry_cache[key] = value
+        return value
+
+    def _schedule_update(self, source):
+        self.update_pool.submit(self._update_source, source)
+
+    def _update_source(self, source):
+        try:
+            source.update()
+        except Exception as e:
+            log.exception(f"Failed to update {source.NAME}: {e}")
+        # the executor would swallow this exception
+        try:
+            self._topic_callback()
+        except Exception as e:
+            log.exception(f"Failed to update topics: {e}")
+
     def _rejoin_channels(self):
         for channel in supybot.conf.supybot.networks.get(self.irc.network).get(
             "channels"
@@ -162,39 +276,118 @@ class DebianDevelChanges(supybot.callbacks.Plugin):
             log.info(f"Rejoining {channel}")
             self.irc.queueMsg(supybot.ircmsgs.join(channel))
 
-    def _email_callback(self):
+    def _start_mail_watcher(self):
+        if inotify_simple is None:
+            return False
+
+        try:
+            inotify = inotify_simple.INotify()
+            inotify.add_watch(
+                self._inject_maildir,
+                inotify_simple.flags.MOVED_TO | inotify_simple.flags.CLOSE_WRITE,
+            )
+        except OSError as e:
+            log.warning(f"Failed to watch {self._inject_maildir}: {e}")
+            return False
+
+        threading.Thread(
+            target=self._watch_mail,
+            args=(inotify,),
+            name="ddc-mail-watcher",
+            daemon=True,
+        ).start()
+        return True
+
+    def _watch_mail(self, inotify):
+        with inotify:
+            while not self.mail_watcher_stop.is_set():
+                if not inotify.read(timeout=1000, read_delay=100):
+                    continue
+
+                # keep watching if processing fails, otherwise mails would
+                # only be picked up by the slow poll from now on
+                try:
+                    # wait for a running poll to finish, it might have missed
+                    # the new mails
+                    self._email_callback(blocking=True)
+                except Exception as e:
+                    log.exception(f"Failed to process mails: {e}")
+
+    def _email_callback(self, blocking=False):
         # make sure that we only process from one thread
-        if self.mail_lock.locked():
+        if not self.mail_lock.acquire(blocking=blocking):
             return
 
-        with self.mail_lock:
-            for mail in os.listdir(self._inject_maildir):
-                mail = os.path.join(self._inject_maildir, mail)
-                if not os.path.isfile(mail):
-                    continue
+        try:
+            with os.scandir(self._inject_maildir) as it:
+                for entry in it:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
 
-                log.info(f"Processing mail {mail}")
-                with open(mail, mode="rb") as fileobj:
-                    res = self._process_mail(fileobj)
-                if res == ProcessingResult.ACTION:
-                    # store mails that caused an action (for 7 days)
-                    log.info(
-                        f"Mail {mail} caused action, storing in {self._processed_maildir}"
-                    )
-                    shutil.move(mail, self._processed_maildir)
-                elif res == ProcessingResult.NO_ACTION:
-                    # remove mails that caused no action
-                    log.info(f"Mail {mail} caused no action")
-                    os.unlink(mail)
-                else:
-                    # store mails that failed to be processed
-                    log.info(
-                        f"Processing mail {mail} failed, storing in {self._failed_maildir}"
-                    )
-                    shutil.move(mail, self._failed_maildir)
+                    mail = entry.path
+                    log.info(f"Processing mail {mail}")
+                    with open(mail, mode="rb") as fileobj:
+                        res = self._process_mail(fileobj)
+                    if res == ProcessingResult.ACTION:
+                        # store mails that caused an action (for 7 days)
+                        log.info(
+                            f"Mail {mail} caused action, storing in {self._processed_maildir}"
+                        )
+                        shutil.move(mail, self._processed_maildir)
+                    elif res == ProcessingResult.NO_ACTION:
+                        # remove mails that caused no action
+                        log.info(f"Mail {mail} caused no action")
+                        os.unlink(mail)
+                    else:
+                        # store mails that failed to be processed
+                        log.info(
+                            f"Processing mail {mail} failed, storing in {self._failed_maildir}"
+                        )
+                        shutil.move(mail, self._failed_maildir)
+        finally:
+            self.mail_lock.release()
 
     def _process_mail(self, fileobj):
         try:
+            # Read the settings of all channels once up front. Channels sharing
+            # the same filters get the same result, so group them and evaluate
+            # every distinct set of filters only once.
+            groups = {}
+            send_privmsg = {}
+            for channel in list(self.irc.state.channels):
+                key = (
+                    # match package or nothing by default
+                    self.registryValue("package_regex", channel) or MATCH_NOTHING,
+                    self.registryValue("maintainer_regex", channel),
+                    self.registryValue("distribution_regex", channel),
+                )
+                groups.setdefault(key, []).append(channel)
+                send_privmsg[channel] = self.registryValue("send_privmsg", channel)
+
+            # only look up maintainers if some channel is going to use them
+            needs_maintainer = any(key[1] for key in groups)
+
+            # Union of all package regexes to reject packages no channel is
+            # interested in with a single scan.
+            package_regexes = tuple(
+                dict.fromkeys(key[0] for key in groups if key[0] is not MATCH_NOTHING)
+            )
+            if package_regexes != self.package_union[0]:
+                self.package_union = (package_regexes, union_regex(package_regexes))
+            package_union = self.package_union[1]
+
+            # Skip parsing mails no channel can be interested in, judging by
+            # the headers only. Without any channels, e.g. before joining after
+            # a restart, go the full way so that the mails are kept.
+            if groups and not needs_maintainer and package_union is not None:
+                if package_union is MATCH_NOTHING:
+                    return ProcessingResult.NO_ACTION
+                header_packages = bug_mail_packages(fileobj)
+                if header_packages is not None and not any(
+                    package_union.search(package) for package in header_packages
+                ):
+                    return ProcessingResult.NO_ACTION
+
             emailmsg = parse_mail(fileobj)
             msg = get_message(emailmsg, new_queue=self.new_queue)
             if not msg:
@@ -203,70 +396,76 @@ class DebianDevelChanges(supybot.callbacks.Plugin):
             txt = colourise(msg.for_irc())
 
             # Simple flood/duplicate detection
-            if txt in self.last_n_messages:
+            if txt in self.last_n_messages_set:
                 return ProcessingResult.NO_ACTION
-            self.last_n_messages.insert(0, txt)
-            self.last_n_messages = self.last_n_messages[:20]
+            if len(self.last_n_messages) == self.last_n_messages.maxlen:
+                self.last_n_messages_set.discard(self.last_n_messages[-1])
+            self.last_n_messages.appendleft(txt)
+            self.last_n_messages_set.add(txt)
 
             packages = [package.strip() for package in msg.package.split(",")]
 
-            maintainer_info = None
-            if hasattr(msg, "maintainer"):
-                maintainer_info = (split_address(msg.maintainer),)
-            else:
-                maintainer_info = []
-                for package in packages:
-                    try:
-                        maintainer_info.append(self.apt_archive.get_maintainer(package))
-                    except DataSource.DataError as e:
-                        log.info(f"Failed to query maintainer for {package}: {e}")
-
-            for channel in self.irc.state.channels:
-                # match package or nothing by default
-                package_regex = self.registryValue("package_regex", channel) or "a^"
-                package_match = False
-                for package in packages:
-                    package_match = re.search(package_regex, package)
-                    if package_match:
-                        break
-
-                maintainer_match = False
-                maintainer_regex = self.registryValue("maintainer_regex", channel)
-                if (
-                    maintainer_regex
-                    and maintainer_info is not None
-                    and len(maintainer_info) >= 0
-                ):
-                    for mi in maintainer_info:
-                        maintainer_match = re.search(maintainer_regex, mi["email"])
-                        if maintainer_match:
-                            break
+            maintainer_info = []
+            if needs_maintainer:
+                if hasattr(msg, "maintainer"):
+                    maintainer_info = (split_address(msg.maintainer),)
+                else:
+                    for package in packages:
+                        try:
+                            maintainer_info.append(
+                                self.apt_archive.get_maintainer(package)
+                            )
+                        except DataSource.DataError as e:
+                            log.info(f"Failed to query maintainer for {package}: {e}")
+
+            any_package_match = package_union is None or any(
+                package_union.search(package) for package in packages
+            )
 
+            ircmsgs = []
+            for key, channels in groups.items():
+                package_regex, maintainer_regex, distribution_regex = key
+
+                package_match = any_package_match and any(
+                    package_regex.search(package) for package in packages
+                )
+                maintainer_match = maintainer_regex is not None and any(
+                    maintainer_regex.search(mi["email"]) for mi in maintainer_info
+                )
                 if not package_match and not maintainer_match:
                     continue
 
-                distribution_regex = self.registryValue("distribution_regex", channel)
-
                 if distribution_regex:
                     if not hasattr(msg, "distribution"):
-                        # If this channel has a distribution regex, don't
+                        # If these channels have a distribution regex, don't
                         # bother continuing unless the message actually has a
                         # distribution. This filters security messages, etc.
                         continue
 
-                    if not re.search(distribution_regex, msg.distribution):
+                    if not distribution_regex.search(msg.distribution):
                         # Distribution doesn't match regex; don't send this
                         # message.
                         continue
 
-                send_privmsg = self.registryValue("send_privmsg", channel)
-                # Send NOTICE per default and if 'send_privmsg' is set for the
-                # channel, send PRIVMSG instead.
-                if send_privmsg:
-                    ircmsg = supybot.ircmsgs.privmsg(channel, txt)
-                else:
-                    ircmsg = supybot.ircmsgs.notice(channel, txt)
+                for channel in channels:
+                    # Send NOTICE per default and if 'send_privmsg' is set for
+                    # the channel, send PRIVMSG instead.
+                    if send_privmsg[channel]:
+                        ircmsg = supybot.ircmsgs.privmsg(channel, txt)
+                    else:
+                        ircmsg = supybot.ircmsgs.notice(channel, txt)
 
+                    ircmsgs.append(ircmsg)
+
+            # Like mails rejected by the pre-scan above, a message none of the
+            # joined channels is interested in caused no action.
+            if groups and not ircmsgs:
+                return ProcessingResult.NO_ACTION
+
+            # Only queue the messages once all channels have been matched, so
+            # that a failure half way through does not announce to only some
+            # of them.
+            for ircmsg in ircmsgs:
                 self.irc.queueMsg(ircmsg)
         except Exception as e:
             log.exception(f"Uncaught exception: {e}")
@@ -292,32 +491,51 @@ class DebianDevelChanges(supybot.callbacks.Plugin):
                 if new_value is not None:
                     values[prefix] = new_value
 
-            for channel in self.irc.state.channels:
-                new_topic = topic = self.irc.state.getTopic(channel)
+            for channel in list(self.irc.state.channels):
+                topic = self.irc.state.getTopic(channel)
+
+                # If the topic did not change since the last run, only the
+                # sections whose values changed need to be rewritten.
+                new_topic, old_values = topic, {}
+                cached = self.topic_rewrites.get(channel)
+                if (
+                    cached is not None
+                    and cached[0] == topic
+                    and cached[2].keys() == values.keys()
+                ):
+                    new_topic, old_values = cached[1], cached[2]
 
                 for prefix, value in values.items():
-                    new_topic = rewrite_topic(new_topic, prefix, value)
+                    if old_values.get(prefix) != value:
+                        new_topic = rewrite_topic(new_topic, prefix, value)
+                self.topic_rewrites[channel] = (topic, new_topic, values)
 
-                if topic != new_topic:
-                    self.queued_topics[channel] = new_topic
+                if topic == new_topic:
+                    continue
+                if channel in self.pending_topics:
+                    # the pending change picks up the queued topic when it fires
+                    if self.queued_topics.get(channel) != new_topic:
+                        self.queued_topics[channel] = new_topic
+                        log.info(f"Updating queued topic in {channel} to '{new_topic}'")
+                    continue
 
-                    if channel not in channels:
-                        log.info(
-                            f"Queueing change of topic in {channel} to '{new_topic}'"
-                        )
-                        channels.add(channel)
+                self.queued_topics[channel] = new_topic
+                self.pending_topics.add(channel)
+                log.info(f"Queueing change of topic in {channel} to '{new_topic}'")
+                channels.add(channel)
 
         for channel in channels:
             event_name = f"{channel}_topic"
             schedule_remove_event(event_name)
-
-            def update_topic(channel=channel):
-                self._update_topic(channel)
-
-            schedule.addEvent(update_topic, time.time() + 60, event_name)
+            schedule.addEvent(
+                functools.partial(self._update_topic, channel),
+                time.time() + 60,
+                event_name,
+            )
 
     def _update_topic(self, channel):
         with self.topic_lock:
+            self.pending_topics.discard(channel)
             try:
                 new_topic = self.queued_topics[channel]
                 log.info(f"Changing topic in {channel} to '{new_topic}'")
@@ -328,10 +546,8 @@ class DebianDevelChanges(supybot.callbacks.Plugin):
     def rc(self, irc, msg, args):
         """Link to UDD RC bug overview."""
         num_bugs = self.testing_rc_bugs.get_number_bugs()
-        if type(num_bugs) is int:
-            irc.reply(
-                f"There are {num_bugs} release-critical bugs in the testing distribution. See https://udd.debian.org/bugs.cgi?release=bullseye&notmain=ign&merged=ign&rc=1"
-            )
+        if isinstance(num_bugs, int):
+            irc.reply(_RC_REPLY.format(num_bugs=num_bugs))
         else:
             irc.reply("No data at this time.")
 
@@ -344,9 +560,19 @@ class DebianDevelChanges(supybot.callbacks.Plugin):
             irc.reply("You are not authorised to run this command.")
             return
 
-        for source in self.data_sources:
-            source.update()
-            irc.reply(f"Updated {source.NAME}.")
+        futures = {
+            self.update_pool.submit(source.update): source
+            for source in self.data_sources
+        }
+        for future in concurrent.futures.as_completed(futures):
+            source = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                log.exception(f"Failed to update {source.NAME}: {e}")
+                irc.reply(f"Failed to update {source.NAME}.")
+            else:
+                irc.reply(f"Updated {source.NAME}.")
         self._topic_callback()
 
     update = wrap(update)
@@ -371,12 +597,6 @@ class DebianDevelChanges(supybot.callbacks.Plugin):
 
     madison = wrap(madison, ["text"])
 
-    def get_pool_url(self, package):
-        if package.startswith("lib"):
-            return (package[:4], package)
-        else:
-            return (package[:1], package)
-
     def _maintainer(self, irc, msg, args, items):
         """Get maintainer for package."""
         for package in items:
@@ -390,11 +610,13 @@ class DebianDevelChanges(supybot.callbacks.Plugin):
                 if login.endswith("@debian.org"):
                     login = login.replace("@debian.org", "")
 
-                msg = f"[desc]Maintainer for[reset] [package]{package}[reset] [desc]is[reset] [by]{display_name}[reset]: [url]https://qa.debian.org/developer.php?login={login}[/url]"
+                msg = _MAINTAINER_REPLY.format(
+                    package=package, display_name=display_name, login=login
+                )
             else:
-                msg = f'Unknown source package "{package}"'
+                msg = _UNKNOWN_PACKAGE_REPLY.format(package=package)
 
-            irc.reply(colourise(msg), prefixNick=False)
+            irc.reply(msg, prefixNick=False)
 
     maintainer = wrap(_maintainer, [many("anything")])
     maint = wrap(_maintainer, [many("anything")])
@@ -403,8 +625,7 @@ class DebianDevelChanges(supybot.callbacks.Plugin):
     def _qa(self, irc, msg, args, items):
         """Get link to QA page."""
         for package in items:
-            msg = f"[desc]QA page for[reset] [package]{package}[reset]: [url]https://tracker.debian.org/pkg/{package}[/url]"
-            irc.reply(colourise(msg), prefixNick=False)
+            irc.reply(_QA_REPLY.format(package=package), prefixNick=False)
 
     qa = wrap(_qa, [many("anything")])
     overview = wrap(_qa, [many("anything")])
@@ -415,12 +636,10 @@ class DebianDevelChanges(supybot.callbacks.Plugin):
     def _changelog(self, irc, msg, args, items):
         """Get link to changelog."""
         for package in items:
-            url = (
-                "https://packages.debian.org/changelogs/pool/main/%s/%s/current/changelog"
-                % self.get_pool_url(package)
+            msg = _CHANGELOG_REPLY.format(
+                package=package, pool_url=get_pool_url(package)
             )
-            msg = f"[desc]debian/changelog for[reset] [package]{package}[reset]: [url]{url}[/url]"
-            irc.reply(colourise(msg), prefixNick=False)
+            irc.reply(msg, prefixNick=False)
 
     changelog = wrap(_changelog, [many("anything")])
     changes = wrap(_changelog, [many("anything")])
@@ -428,20 +647,17 @@ class DebianDevelChanges(supybot.callbacks.Plugin):
     def _copyright(self, irc, msg, args, items):
         """Link to copyright files."""
         for package in items:
-            url = (
-                "https://packages.debian.org/changelogs/pool/main/%s/%s/current/copyright"
-                % self.get_pool_url(package)
+            msg = _COPYRIGHT_REPLY.format(
+                package=package, pool_url=get_pool_url(package)
             )
-            msg = f"[desc]debian/copyright for[reset] [package]{package}[reset]: [url]{url}[/url]"
-            irc.reply(colourise(msg), prefixNick=False)
+            irc.reply(msg, prefixNick=False)
 
     copyright = wrap(_copyright, [many("anything")])
 
     def _buggraph(self, irc, msg, args, items):
         """Link to bug graph."""
         for package in items:
-            msg = f"[desc]Bug graph for[reset] [package]{package}[reset]: [url]https://qa.debian.org/data/bts/graphs/{package[0]}/{package}.png[/url]"
-            irc.reply(colourise(msg), prefixNick=False)
+            irc.reply(_BUGGRAPH_REPLY.format(package=package), prefixNick=False)
 
     buggraph = wrap(_buggraph, [many("anything")])
     bug_graph = wrap(_buggraph, [many("anything")])
@@ -449,8 +665,7 @@ class DebianDevelChanges(supybot.callbacks.Plugin):
     def _buildd(self, irc, msg, args, items):
         """Link to buildd page."""
         for package in items:
-            msg = f"[desc]buildd status for[reset] [package]{package}[reset]: [url]https://buildd.debian.org/pkg.cgi?pkg={package}[/url]"
-            irc.reply(colourise(msg), prefixNick=False)
+            irc.reply(_BUILDD_REPLY.format(package=package), prefixNick=False)
 
     buildd = wrap(_buildd, [many("anything")])
 
@@ -468,8 +683,7 @@ class DebianDevelChanges(supybot.callbacks.Plugin):
     def _testing(self, irc, msg, args, items):
         """Check testing migration status."""
         for package in items:
-            msg = f"[desc]Testing migration status for[reset] [package]{package}[reset]: [url]https://qa.debian.org/excuses.php?package={package}[/url]"
-            irc.reply(colourise(msg), prefixNick=False)
+            irc.reply(_TESTING_REPLY.format(package=package), prefixNick=False)
 
     testing = wrap(_testing, [many("anything")])
     migration = wrap(_testing, [many("anything")])
@@ -477,8 +691,7 @@ class DebianDevelChanges(supybot.callbacks.Plugin):
     def _new(self, irc, msg, args):
         """Link to NEW queue."""
         size = self.new_queue.get_size()
-        line = f"[desc]NEW queue is[reset]: [url]https://ftp-master.debian.org/new.html[/url]. [desc]Current size is:[reset] {size}"
-        irc.reply(colourise(line))
+        irc.reply(_NEW_REPLY.format(size=size))
 
     new = wrap(_new)
     new_queue = wrap(_new)
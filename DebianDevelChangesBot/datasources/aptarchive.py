@@ -16,6 +16,7 @@
 #   along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import os
+import threading
 import apt_pkg
 
 from .. import pseudo_packages, DataSource
@@ -45,6 +46,10 @@ class AptArchive(DataSource):
         self.depcache = apt_pkg.DepCache(self.cache)
         self.source_list = apt_pkg.SourceList()
         self.source_list.read_main_list()
+        # maintainer lookups, valid until the cache is re-opened
+        self.maintainers = {}
+        # update() and lookups run on different threads
+        self.lock = threading.Lock()
 
     def update_index(self, ignore_errors=False):
         import apt.progress.base
@@ -58,14 +63,34 @@ class AptArchive(DataSource):
                     raise DataSource.DataError(f"Failed to update cache: {e}")
 
     def update(self):
-        self.cache = apt_pkg.Cache(None)
-        self.depcache = apt_pkg.DepCache(self.cache)
+        cache = apt_pkg.Cache(None)
+        depcache = apt_pkg.DepCache(cache)
+
+        with self.lock:
+            self.cache = cache
+            self.depcache = depcache
+            self.maintainers = {}
 
     def get_maintainer(self, package):
+        # pseudo packages are updated more often than the cache is re-opened,
+        # so only cache maintainers obtained from apt
         maintainer = pseudo_packages.get_maintainer(package)
         if maintainer is not None:
             return split_address(maintainer)
 
+        with self.lock:
+            # do not store stale results in the dict of a re-opened cache
+            maintainers = self.maintainers
+            try:
+                return maintainers[package]
+            except KeyError:
+                pass
+
+            maintainer = self._lookup_maintainer(package)
+            maintainers[package] = maintainer
+            return maintainer
+
+    def _lookup_maintainer(self, package):
         if package in self.cache:
             candidate = self.depcache.get_candidate_ver(self.cache[package])
             if candidate is not None:
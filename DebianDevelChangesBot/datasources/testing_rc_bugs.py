@@ -16,6 +16,11 @@
 #   You should have received a copy of the GNU Affero General Public License
 #   along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+try:
+    import orjson as json
+except ImportError:
+    import json
+
 from .. import DataSource
 
 
@@ -39,7 +44,9 @@ class RCBugs(DataSource):
 
         response = self.session.get(self.URL, params=payload)
         try:
-            data = response.json()
+            # the list of all RC bugs is large, so parse it with orjson if
+            # available
+            data = json.loads(response.content)
         except ValueError:
             raise DataSource.DataError()
 
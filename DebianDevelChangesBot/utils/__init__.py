@@ -23,3 +23,5 @@ from .irc_colours import colourise
 from .rewrite_topic import rewrite_topic
 from .madison import madison
 from .popcon import popcon
+from .union_regex import union_regex
+from .bug_mail_packages import bug_mail_packages
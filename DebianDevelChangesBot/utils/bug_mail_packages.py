@@ -0,0 +1,59 @@
+#
+#   Debian Changes Bot
+#   Copyright (C) 2026 Debian Changes Bot contributors
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as
+#   published by the Free Software Foundation, either version 3 of the
+#   License, or (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import email.parser
+
+_BUG_LISTS = (
+    "<debian-bugs-dist.lists.debian.org>",
+    "<debian-bugs-closed.lists.debian.org>",
+)
+
+
+def bug_mail_packages(fileobj):
+    """Get the packages a bug mail is about from its headers.
+
+    Only the header block is read and fileobj is rewound afterwards. Returns
+    None if the mail is not from one of the bug lists or the headers cannot be
+    decoded.
+    """
+    lines = []
+    for line in fileobj:
+        if line in (b"\n", b"\r\n"):
+            break
+        lines.append(line)
+    fileobj.seek(0)
+
+    headers = email.parser.BytesHeaderParser().parsebytes(b"".join(lines))
+    values = [
+        headers.get(name, "")
+        for name in ("List-Id", "X-Debian-PR-Package", "X-Debian-PR-Source")
+    ]
+    # headers with 8-bit data are returned as email.header.Header; leave those
+    # to the full parser
+    if not all(isinstance(value, str) for value in values):
+        return None
+
+    if values[0].strip() not in _BUG_LISTS:
+        return None
+
+    packages = []
+    for value in values[1:]:
+        value = value.replace("\n", "").replace("\t", " ")
+        packages.extend(
+            package.strip() for package in value.split(",") if package.strip()
+        )
+    return packages
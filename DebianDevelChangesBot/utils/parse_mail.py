@@ -28,16 +28,17 @@ def parse_mail(fileobj):
         k: quoted_printable(v).replace("\n", "").replace("\t", " ").strip()
         for k, v in msg.items()
     }
-    body = [line.replace("\n", "") for line in email.iterators.body_line_iterator(msg)]
-
-    # Merge lines joined with "=\n"
-    i = len(body) - 1
-    while i > 0:
-        i -= 1
-        prev = body[i]
-        if len(prev) == 74 and prev.endswith("="):
-            body[i] = body[i][:-1] + body[i + 1]
-            del body[i + 1]
+    lines = [line.replace("\n", "") for line in email.iterators.body_line_iterator(msg)]
+
+    # Merge lines joined with "=\n"; walk backwards so that a line can be
+    # joined with the already merged lines following it.
+    body = []
+    for line in reversed(lines):
+        if body and len(line) == 74 and line.endswith("="):
+            body[-1] = line[:-1] + body[-1]
+        else:
+            body.append(line)
+    body.reverse()
 
     # Remove =20 from end of lines
     i = 0
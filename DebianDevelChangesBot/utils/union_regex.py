@@ -0,0 +1,42 @@
+#
+#   Debian Changes Bot
+#   Copyright (C) 2026 Debian Changes Bot contributors
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as
+#   published by the Free Software Foundation, either version 3 of the
+#   License, or (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import re
+
+# union of no patterns, also used for channels without a package_regex
+MATCH_NOTHING = re.compile("a^")
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(\d")
+
+
+def union_regex(patterns):
+    """Combine patterns into a single alternation matching if any of them does.
+
+    Returns None if the patterns cannot be combined without changing their
+    meaning, i.e. if they use flags, backreferences or numbered conditionals.
+    """
+    if not patterns:
+        return MATCH_NOTHING
+    if any(
+        pattern.flags != re.UNICODE or _BACKREFERENCE.search(pattern.pattern)
+        for pattern in patterns
+    ):
+        return None
+
+    try:
+        return re.compile("|".join(f"(?:{pattern.pattern})" for pattern in patterns))
+    except re.error:
+        return None
@@ -9,6 +9,7 @@ setup(
         "beautifulsoup4",
         "python-debian",
         "requests",
+        "urllib3",
         "python-apt",
     ],
 )
@@ -99,6 +99,15 @@ class TestDatasourceAptArchive(unittest.TestCase):
         info = self.apt_archive.get_maintainer("qa.debian.org")
         self.assertEqual(info["email"], "debian-qa@lists.debian.org")
 
+    def testCachedMaintainer(self):
+        info = self.apt_archive.get_maintainer("vlc")
+        self.assertIs(self.apt_archive.get_maintainer("vlc"), info)
+
+        self.apt_archive.update()
+        self.assertNotIn("vlc", self.apt_archive.maintainers)
+        info = self.apt_archive.get_maintainer("vlc")
+        self.assertEqual(info["email"], "debian-multimedia@lists.debian.org")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+#
+#   Debian Changes Bot
+#   Copyright (C) 2026 Debian Changes Bot contributors
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as
+#   published by the Free Software Foundation, either version 3 of the
+#   License, or (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import io
+import os
+import unittest
+from glob import glob
+
+from DebianDevelChangesBot.mailparsers import get_message
+from DebianDevelChangesBot.utils import bug_mail_packages, parse_mail
+
+
+def fixtures(testdir):
+    return glob(
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "fixtures", testdir, "*"
+        )
+    )
+
+
+class TestBugMailPackages(unittest.TestCase):
+    def testFixtures(self):
+        """
+        The packages from the headers must include those of the parsed mail.
+        """
+        for filename in fixtures("bug_closed") + fixtures("bug_submitted"):
+            with self.subTest(filename=filename), open(filename, "rb") as infile:
+                packages = bug_mail_packages(infile)
+                self.assertEqual(infile.tell(), 0)
+                msg = get_message(parse_mail(infile))
+
+                self.assertIsNotNone(packages)
+                expected = {package.strip() for package in msg.package.split(",")}
+                self.assertLessEqual(expected, set(packages))
+
+    def testAcceptedUpload(self):
+        for filename in fixtures("accepted_upload"):
+            with self.subTest(filename=filename), open(filename, "rb") as infile:
+                self.assertIsNone(bug_mail_packages(infile))
+                self.assertEqual(infile.tell(), 0)
+
+    def testMultiPackages(self):
+        mail = (
+            b"List-Id: <debian-bugs-closed.lists.debian.org>\n"
+            b"X-Debian-PR-Package: binary-package\n"
+            b"X-Debian-PR-Source: source-package, source-package2\n"
+            b"\n"
+            b"body\n"
+        )
+        self.assertEqual(
+            bug_mail_packages(io.BytesIO(mail)),
+            ["binary-package", "source-package", "source-package2"],
+        )
+
+    def test8BitHeader(self):
+        mail = (
+            "List-Id: Café <debian-bugs-dist.lists.debian.org>\n"
+            "X-Debian-PR-Package: vlc\n"
+            "\n"
+            "body\n"
+        ).encode("latin-1")
+        self.assertIsNone(bug_mail_packages(io.BytesIO(mail)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+#
+#   Debian Changes Bot
+#   Copyright (C) 2026 Debian Changes Bot contributors
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as
+#   published by the Free Software Foundation, either version 3 of the
+#   License, or (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import re
+import unittest
+
+from DebianDevelChangesBot.utils import union_regex
+
+
+class TestUnionRegex(unittest.TestCase):
+    def testEmpty(self):
+        union = union_regex(())
+        self.assertIsNotNone(union)
+        self.assertIsNone(union.search(""))
+        self.assertIsNone(union.search("vlc"))
+
+    def testSingle(self):
+        union = union_regex((re.compile("^vlc$"),))
+        self.assertTrue(union.search("vlc"))
+        self.assertFalse(union.search("libvlc"))
+
+    def testMultiple(self):
+        union = union_regex((re.compile("^vlc$"), re.compile("^lib(foo|bar)")))
+        self.assertTrue(union.search("vlc"))
+        self.assertTrue(union.search("libbar1"))
+        self.assertFalse(union.search("libbaz"))
+        self.assertFalse(union.search("vlc-data"))
+
+    def testAlternationIsScoped(self):
+        union = union_regex((re.compile("^a|b$"), re.compile("^c$")))
+        self.assertTrue(union.search("a-x"))
+        self.assertTrue(union.search("x-b"))
+        self.assertTrue(union.search("c"))
+        self.assertFalse(union.search("x-c"))
+
+    def testFlags(self):
+        self.assertIsNone(union_regex((re.compile("vlc", re.I),)))
+        self.assertIsNone(union_regex((re.compile("vlc"), re.compile("(?i)foo"))))
+
+    def testBackreference(self):
+        self.assertIsNone(union_regex((re.compile("x"), re.compile(r"(a)\1"))))
+        self.assertIsNone(union_regex((re.compile("x"), re.compile("(?P<a>a)(?P=a)"))))
+
+    def testConditional(self):
+        pattern = re.compile("(x)?(?(1)y|z)")
+        self.assertTrue(pattern.search("xy"))
+        self.assertIsNone(union_regex((re.compile("(a)"), pattern)))
+
+    def testInvalidCombination(self):
+        self.assertIsNone(
+            union_regex((re.compile("(?P<name>a)"), re.compile("(?P<name>b)")))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()